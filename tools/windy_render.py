@@ -29,15 +29,18 @@ Run (server – skip C header):
 
 import argparse
 import math
-import struct
 import sys
 import time
 import os
 import datetime
+import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # ── Target & display configuration ──────────────────────────────────────────
 
@@ -50,6 +53,21 @@ ZOOM      = 9        # tile zoom (~80 km wide at this latitude)
 WIDTH     = 480
 HEIGHT    = 272
 TILE_SIZE = 256
+TILE_WORKERS = 8     # max concurrent tile downloads (keep polite to OSM)
+HA_WORKERS   = 8     # max concurrent per-entity HA requests (fallback path)
+
+# On-disk OSM tile cache: <TILE_CACHE_DIR>/<zoom>/<x>/<y>.png
+# Set TILE_CACHE_DIR to None to disable (see --no-cache).
+TILE_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".tile_cache")
+TILE_CACHE_TTL = 7 * 24 * 3600   # seconds; OSM tiles change on a scale of months
+
+# Last Open-Meteo response, reused while fresh and revalidated via ETag /
+# Last-Modified afterwards (the model updates hourly). Set WEATHER_CACHE to
+# None to disable (see --no-weather-cache). WEATHER_TTL must stay well below
+# the 10-min windy-render.timer period, or every other run would reuse a
+# 10-min-old forecast instead of revalidating.
+WEATHER_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".weather_cache.json")
+WEATHER_TTL   = 300   # seconds
 
 PANEL_W   = 150      # left data-panel width in pixels
 TILE_ATTR = "© OpenStreetMap contributors"
@@ -66,6 +84,15 @@ TILE_AREA_H = 210
 TILE_W = TILE_AREA_W // TILE_COLS   # 82
 TILE_H = TILE_AREA_H // TILE_ROWS   # 52
 
+# ── Fonts (loaded once; each load_default() call re-parses the TTF) ─────────
+
+_FNT_30 = ImageFont.load_default(size=30)
+_FNT_20 = ImageFont.load_default(size=20)
+_FNT_14 = ImageFont.load_default(size=14)
+_FNT_11 = ImageFont.load_default(size=11)
+_FNT_9  = ImageFont.load_default(size=9)
+_FNT_8  = ImageFont.load_default(size=8)
+
 # ── Tile maths ───────────────────────────────────────────────────────────────
 
 def _latlon_to_tile_float(lat, lon, zoom):
@@ -87,20 +114,75 @@ def _tile_float_to_pixel(tx_f, ty_f, origin_tx_f, origin_ty_f):
 _SESSION = requests.Session()
 _SESSION.headers.update({"User-Agent": "STM32F746-windy-display/1.0 "
                                         "(github: embedded-weather-demo)"})
-
-def _fetch_tile(x, y, zoom, retries=3):
+# One pool per host (OSM tiles, Open-Meteo, HA), each large enough for the
+# biggest concurrent fan-out; transient errors are retried by urllib3 with
+# exponential backoff. Plain http:// is the HA REST API.
+_HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=4, pool_maxsize=max(TILE_WORKERS, HA_WORKERS),
+    max_retries=Retry(total=3, backoff_factor=0.3,
+                      status_forcelist=[429, 500, 502, 503, 504]))
+_SESSION.mount("https://", _HTTP_ADAPTER)
+_SESSION.mount("http://",  _HTTP_ADAPTER)
+
+def _tile_cache_path(x, y, zoom):
+    return os.path.join(TILE_CACHE_DIR, str(zoom), str(int(x)), f"{int(y)}.png")
+
+# Decoded tiles kept in-process so repeated renders skip the disk read and
+# PNG decode: (zoom, x, y) -> (fetched_at, RGB image), oldest evicted first.
+# Only helps long-lived importers (the systemd timer starts a fresh process
+# per render). Not thread-safe: only touched from build_map_canvas' thread.
+_TILE_MEM     = {}
+_TILE_MEM_MAX = 64
+
+def _remember_tile(x, y, zoom, img, fetched_at):
+    if len(_TILE_MEM) >= _TILE_MEM_MAX:
+        _TILE_MEM.pop(next(iter(_TILE_MEM)), None)
+    _TILE_MEM[(zoom, int(x), int(y))] = (fetched_at, img)
+
+def _cached_tile(x, y, zoom):
+    """Return the cached tile, or None if caching is off or the entry is missing/stale."""
+    hit = _TILE_MEM.get((zoom, int(x), int(y)))
+    if hit and time.time() - hit[0] < TILE_CACHE_TTL:
+        return hit[1]
+    if TILE_CACHE_DIR is None:
+        return None
+    path = _tile_cache_path(x, y, zoom)
+    try:
+        mtime = os.path.getmtime(path)
+        if time.time() - mtime < TILE_CACHE_TTL:
+            img = Image.open(path).convert("RGB")
+            _remember_tile(x, y, zoom, img, mtime)
+            return img
+    except OSError:
+        pass
+    return None
+
+def _store_tile(x, y, zoom, content):
+    if TILE_CACHE_DIR is None:
+        return
+    path = _tile_cache_path(x, y, zoom)
+    tmp  = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # write-then-rename so a concurrent run never reads a half-written tile
+        with open(tmp, "wb") as f:
+            f.write(content)
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"  [warn] tile cache write {path}: {e}")
+
+def _fetch_tile(x, y, zoom):
+    """Download one tile. Returns (image, ok); ok is False for the placeholder."""
     url = f"https://tile.openstreetmap.org/{zoom}/{int(x)}/{int(y)}.png"
-    for attempt in range(retries):
-        try:
-            r = _SESSION.get(url, timeout=12)
-            r.raise_for_status()
-            return Image.open(BytesIO(r.content)).convert("RGB")
-        except Exception as e:
-            if attempt == retries - 1:
-                print(f"  [warn] tile {x},{y} failed: {e} – using placeholder")
-                img = Image.new("RGB", (TILE_SIZE, TILE_SIZE), (22, 27, 38))
-                return img
-            time.sleep(0.5)
+    try:
+        r = _SESSION.get(url, timeout=12)
+        r.raise_for_status()
+        img = Image.open(BytesIO(r.content)).convert("RGB")
+    except Exception as e:
+        print(f"  [warn] tile {x},{y} failed: {e} – using placeholder")
+        return Image.new("RGB", (TILE_SIZE, TILE_SIZE), (22, 27, 38)), False
+    _store_tile(x, y, zoom, r.content)
+    return img, True
 
 def build_map_canvas(map_lat, map_lon, zoom):
     """Download enough tiles to cover WIDTH×HEIGHT centred on (map_lat, map_lon).
@@ -108,44 +190,76 @@ def build_map_canvas(map_lat, map_lon, zoom):
     """
     cx_f, cy_f = _latlon_to_tile_float(map_lat, map_lon, zoom)
 
-    # top-left tile index of the canvas (add 1-tile margin on each side)
-    x0 = int(cx_f) - 1
-    y0 = int(cy_f) - 1
+    # WIDTH×HEIGHT crop window centred on the target, in global pixel coords
+    left_px = int(cx_f * TILE_SIZE) - WIDTH  // 2
+    top_px  = int(cy_f * TILE_SIZE) - HEIGHT // 2
 
-    # how many tiles we need in each direction
-    cols = math.ceil(WIDTH  / TILE_SIZE) + 3
-    rows = math.ceil(HEIGHT / TILE_SIZE) + 3
+    # only the tiles that intersect the crop window (typically 3×2)
+    x0 = left_px // TILE_SIZE
+    y0 = top_px  // TILE_SIZE
+    cols = (left_px + WIDTH  - 1) // TILE_SIZE - x0 + 1
+    rows = (top_px  + HEIGHT - 1) // TILE_SIZE - y0 + 1
 
-    canvas_w = cols * TILE_SIZE
-    canvas_h = rows * TILE_SIZE
-    canvas = Image.new("RGB", (canvas_w, canvas_h), (22, 27, 38))
+    # Tiles are pasted straight into the final WIDTH×HEIGHT image; paste()
+    # clips the parts that fall outside it, so no oversized canvas or crop
+    left = left_px - x0 * TILE_SIZE
+    top  = top_px  - y0 * TILE_SIZE
+    canvas = Image.new("RGB", (WIDTH, HEIGHT), (22, 27, 38))
 
-    print(f"Downloading {cols}×{rows} = {cols*rows} OSM tiles (zoom {zoom})…")
+    # Paste cache hits straight away; only misses go through the download pool
     n_tiles = 2 ** zoom
+    missing = []
     for ty in range(rows):
         for tx in range(cols):
-            tile = _fetch_tile((x0 + tx) % n_tiles, (y0 + ty) % n_tiles, zoom)
-            canvas.paste(tile, (tx * TILE_SIZE, ty * TILE_SIZE))
-            print(f"  tile ({x0+tx}, {y0+ty})", end="\r")
-    print()
-
-    # crop to WIDTH×HEIGHT centered on the target
-    origin_x_f = x0          # fractional tile x of canvas left edge
-    origin_y_f = y0          # fractional tile y of canvas top edge
-
-    cx_px, cy_px = _tile_float_to_pixel(cx_f, cy_f, origin_x_f, origin_y_f)
-    left  = int(cx_px) - WIDTH  // 2
-    top   = int(cy_px) - HEIGHT // 2
-    crop  = canvas.crop((left, top, left + WIDTH, top + HEIGHT))
-
-    # shift origins to match the crop
-    new_ox_f = origin_x_f + left  / TILE_SIZE
-    new_oy_f = origin_y_f + top   / TILE_SIZE
-
-    return crop, new_ox_f, new_oy_f
+            x, y = (x0 + tx) % n_tiles, (y0 + ty) % n_tiles
+            tile = _cached_tile(x, y, zoom)
+            if tile is None:
+                missing.append((tx, ty, x, y))
+            else:
+                canvas.paste(tile, (tx * TILE_SIZE - left, ty * TILE_SIZE - top))
+
+    print(f"Downloading {len(missing)} of {cols}×{rows} = {cols*rows} OSM tiles "
+          f"(zoom {zoom}, {cols*rows - len(missing)} cached)…")
+    if missing:
+        with ThreadPoolExecutor(max_workers=TILE_WORKERS) as ex:
+            futs = {
+                ex.submit(_fetch_tile, x, y, zoom): (tx, ty, x, y)
+                for tx, ty, x, y in missing
+            }
+            for fut in as_completed(futs):
+                tx, ty, x, y = futs[fut]
+                tile, ok = fut.result()
+                if ok:
+                    _remember_tile(x, y, zoom, tile, time.time())
+                canvas.paste(tile, (tx * TILE_SIZE - left, ty * TILE_SIZE - top))
+                print(f"  tile ({x0+tx}, {y0+ty})", end="\r")
+        print()
+
+    # fractional tile coordinates of the canvas's top-left corner
+    return canvas, left_px / TILE_SIZE, top_px / TILE_SIZE
 
 # ── Weather data ─────────────────────────────────────────────────────────────
 
+def _load_weather_cache(url):
+    """Return the cached response dict for `url`, or None."""
+    if WEATHER_CACHE is None:
+        return None
+    try:
+        with open(WEATHER_CACHE) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return cache if cache.get("url") == url else None
+
+def _store_weather_cache(cache):
+    if WEATHER_CACHE is None:
+        return
+    try:
+        with open(WEATHER_CACHE, "w") as f:
+            json.dump(cache, f)
+    except OSError as e:
+        print(f"  [warn] weather cache write {WEATHER_CACHE}: {e}")
+
 def fetch_weather(lat, lon):
     """Return Open-Meteo JSON for current + 24-h hourly forecast."""
     url = (
@@ -159,10 +273,34 @@ def fetch_weather(lat, lon):
         "&forecast_days=1"
         "&wind_speed_unit=kmh"
     )
-    print(f"Fetching weather for {lat}°N {lon}°E …")
-    r = _SESSION.get(url, timeout=10)
-    r.raise_for_status()
-    data = r.json()
+    cache = _load_weather_cache(url)
+    age = time.time() - cache["fetched_at"] if cache else None
+
+    if cache and age < WEATHER_TTL:
+        print(f"Using cached weather for {lat}°N {lon}°E ({age:.0f} s old)")
+        data = cache["body"]
+    else:
+        print(f"Fetching weather for {lat}°N {lon}°E …")
+        headers = {}
+        if cache and cache.get("etag"):
+            headers["If-None-Match"] = cache["etag"]
+        if cache and cache.get("last_modified"):
+            headers["If-Modified-Since"] = cache["last_modified"]
+        r = _SESSION.get(url, headers=headers, timeout=10)
+        if cache and r.status_code == 304:
+            print("  not modified")
+        else:
+            r.raise_for_status()
+            cache = {
+                "url":           url,
+                "etag":          r.headers.get("ETag"),
+                "last_modified": r.headers.get("Last-Modified"),
+                "body":          r.json(),
+            }
+        cache["fetched_at"] = time.time()
+        _store_weather_cache(cache)
+        data = cache["body"]
+
     c = data["current"]
     print(f"  T={c['temperature_2m']}°C  "
           f"wind={c['wind_speed_10m']} km/h @ {c['wind_direction_10m']}°  "
@@ -183,46 +321,58 @@ _WIND_RAMP = [
     (100, (180,  0,180)),   # storm     – magenta
 ]
 
-def _lerp_color(c0, c1, t):
-    return tuple(int(c0[i] + t * (c1[i] - c0[i])) for i in range(3))
+# Ramp sampled once at import: 1024 steps over 0..100 km/h (~0.1 km/h each)
+_WIND_LUT_N   = 1024
+_WIND_LUT_MAX = _WIND_RAMP[-1][0]
+
+def _build_wind_lut():
+    speeds = np.array([s for s, _ in _WIND_RAMP], dtype=np.float64)
+    colours = np.array([c for _, c in _WIND_RAMP], dtype=np.float64)
+    x = np.linspace(0.0, _WIND_LUT_MAX, _WIND_LUT_N)
+    return np.stack([np.interp(x, speeds, colours[:, ch]) for ch in range(3)],
+                    axis=-1).astype(np.uint8)
+
+_WIND_LUT = _build_wind_lut()
+_WIND_LUT_RGB = [tuple(c) for c in _WIND_LUT.tolist()]   # plain-int tuples for wind_color()
 
 def wind_color(speed_kmh):
-    ramp = _WIND_RAMP
-    s = max(0.0, float(speed_kmh))
-    for i in range(len(ramp) - 1):
-        s0, c0 = ramp[i]
-        s1, c1 = ramp[i + 1]
-        if s <= s1:
-            t = (s - s0) / (s1 - s0) if s1 > s0 else 0.0
-            return _lerp_color(c0, c1, t)
-    return ramp[-1][1]
+    s = min(max(0.0, float(speed_kmh)), _WIND_LUT_MAX)
+    return _WIND_LUT_RGB[int(s * ((_WIND_LUT_N - 1) / _WIND_LUT_MAX) + 0.5)]   # nearest entry
+
+def wind_colors(speeds_kmh):
+    """Vectorised wind_color(): array of speeds → (..., 3) uint8 RGB array."""
+    s = np.clip(np.asarray(speeds_kmh, dtype=np.float64), 0.0, _WIND_LUT_MAX)
+    return _WIND_LUT[np.rint(s * ((_WIND_LUT_N - 1) / _WIND_LUT_MAX)).astype(np.intp)]
+
+_BFT_THRESHOLDS = (1, 6, 12, 20, 29, 39, 50, 62, 75, 89, 103, 118)   # km/h
 
 def _beaufort(kmh):
-    thresholds = [1, 6, 12, 20, 29, 39, 50, 62, 75, 89, 103, 118]
-    for b, t in enumerate(thresholds):
+    for b, t in enumerate(_BFT_THRESHOLDS):
         if kmh < t:
             return b
     return 12
 
+_WMO_TABLE = {
+    0: "Clear sky", 1: "Mainly clear", 2: "Partly cloudy", 3: "Overcast",
+    45: "Fog", 48: "Icing fog",
+    51: "Light drizzle", 53: "Drizzle", 55: "Heavy drizzle",
+    61: "Light rain", 63: "Rain", 65: "Heavy rain",
+    71: "Light snow", 73: "Snow", 75: "Heavy snow",
+    77: "Snow grains",
+    80: "Light showers", 81: "Showers", 82: "Heavy showers",
+    85: "Snow showers", 86: "Heavy snow showers",
+    95: "Thunderstorm", 96: "Hail storm", 99: "Heavy hail storm",
+}
+
 def _wmo_description(code):
     """Map WMO weather code to short description."""
-    table = {
-        0: "Clear sky", 1: "Mainly clear", 2: "Partly cloudy", 3: "Overcast",
-        45: "Fog", 48: "Icing fog",
-        51: "Light drizzle", 53: "Drizzle", 55: "Heavy drizzle",
-        61: "Light rain", 63: "Rain", 65: "Heavy rain",
-        71: "Light snow", 73: "Snow", 75: "Heavy snow",
-        77: "Snow grains",
-        80: "Light showers", 81: "Showers", 82: "Heavy showers",
-        85: "Snow showers", 86: "Heavy snow showers",
-        95: "Thunderstorm", 96: "Hail storm", 99: "Heavy hail storm",
-    }
-    return table.get(code, f"WMO {code}")
+    return _WMO_TABLE.get(code, f"WMO {code}")
+
+_ARROWS = "↑↗→↘↓↙←↖"
 
 def _dir_arrow(deg):
     """Unicode arrow pointing in the wind-FROM direction."""
-    arrows = "↑↗→↘↓↙←↖"
-    return arrows[round(deg / 45) % 8]
+    return _ARROWS[round(deg / 45) % 8]
 
 # ── Temperature / Humidity colour coding ─────────────────────────────────────
 
@@ -267,42 +417,81 @@ def fetch_ha_sensors(rooms, ha_url, ha_token):
             print(f"  [warn] HA {entity_id}: {e}")
             return None
 
+    entities = [room[key] for room in rooms if room is not None
+                for key in ("temp_entity", "hum_entity")]
+
+    # One /api/states call returns every entity; look ours up locally
+    try:
+        r = _SESSION.get(f"{ha_url}/api/states", headers=headers, timeout=10)
+        r.raise_for_status()
+        by_id = {s["entity_id"]: s for s in r.json()}
+    except Exception as e:
+        print(f"  [warn] HA /api/states: {e} – falling back to per-entity requests")
+        by_id = None
+
+    if by_id is not None:
+        values = {}
+        for entity_id in entities:
+            try:
+                values[entity_id] = float(by_id[entity_id]["state"])
+            except KeyError:
+                print(f"  [warn] HA {entity_id}: not found")
+                values[entity_id] = None
+            except (TypeError, ValueError) as e:
+                print(f"  [warn] HA {entity_id}: {e}")
+                values[entity_id] = None
+    else:
+        # Per-entity GETs are independent: issue them concurrently
+        with ThreadPoolExecutor(max_workers=max(1, min(HA_WORKERS, len(entities)))) as ex:
+            values = dict(zip(entities, ex.map(_get, entities)))
+
     result = []
     for room in rooms:
         if room is None:
             result.append(None)
             continue
-        temp = _get(room["temp_entity"])
-        hum  = _get(room["hum_entity"])
+        temp = values[room["temp_entity"]]
+        hum  = values[room["hum_entity"]]
         print(f"  {room['name']:10s}  T={temp}  RH={hum}")
         result.append({"name": room["name"], "temp": temp, "hum": hum})
     return result
 
 # ── Sensor tile grid ─────────────────────────────────────────────────────────
 
-def draw_sensor_tiles(draw, sensors, mode):
-    """Draw 4×4 grid of coloured sensor tiles in the map area (x=150..479, y=0..209).
+TILE_AREA_BOX = (TILE_AREA_X, TILE_AREA_Y,
+                 TILE_AREA_X + TILE_AREA_W, TILE_AREA_Y + TILE_AREA_H)
 
-    mode: 'temp' for temperature view, 'hum' for humidity view.
-    Empty grid cells (sensors[i] is None) get a dark placeholder tile.
-    """
-    fnt_name = ImageFont.load_default(size=9)
-    fnt_val  = ImageFont.load_default(size=20)
-    fnt_unit = ImageFont.load_default(size=8)
-    GREY = (130, 135, 160)
+def _tile_origin(idx, origin=(TILE_AREA_X, TILE_AREA_Y)):
+    """Top-left pixel of grid cell `idx` (row-major), grid placed at `origin`."""
+    return (origin[0] + (idx % TILE_COLS) * TILE_W,
+            origin[1] + (idx // TILE_COLS) * TILE_H)
 
+def draw_sensor_tile_backgrounds(draw):
+    """Draw the dark background of all 4×4 grid cells (identical in both views)."""
     for idx in range(TILE_COLS * TILE_ROWS):
-        col = idx % TILE_COLS
-        row = idx // TILE_COLS
-        tx = TILE_AREA_X + col * TILE_W
-        ty = TILE_AREA_Y + row * TILE_H
-
-        # Dark tile background (1 px gap between tiles)
+        tx, ty = _tile_origin(idx)
+        # 1 px gap between tiles
         draw.rectangle([(tx, ty), (tx + TILE_W - 2, ty + TILE_H - 2)],
                        fill=(8, 12, 28, 200))
 
+def draw_sensor_tiles(draw, sensors, mode, origin=(TILE_AREA_X, TILE_AREA_Y)):
+    """Draw the per-view contents of the 4×4 sensor grid (x=150..479, y=0..209).
+
+    mode: 'temp' for temperature view, 'hum' for humidity view.
+    origin: where the grid's top-left lands in `draw`'s image – pass (0, 0)
+    to draw into a crop of just the tile area.
+    Expects draw_sensor_tile_backgrounds() to have been applied already;
+    empty grid cells (sensors[i] is None) are left as the dark placeholder.
+    """
+    fnt_name = _FNT_9
+    fnt_val  = _FNT_20
+    fnt_unit = _FNT_8
+    GREY = (130, 135, 160)
+
+    for idx in range(TILE_COLS * TILE_ROWS):
         if idx >= len(sensors) or sensors[idx] is None:
             continue
+        tx, ty = _tile_origin(idx, origin)
 
         sensor = sensors[idx]
 
@@ -328,35 +517,9 @@ def draw_sensor_tiles(draw, sensors, mode):
         else:
             draw.text((tx + 3, ty + 22), "N/A", fill=(100, 100, 100), font=fnt_name)
 
-# ── Wind-field overlay (kept for reference, not used in tile mode) ────────────
-
-def draw_wind_field(draw, speed_base, dir_base, panel_w):
-    """Draw a 15×9 grid of coloured wind arrows over the map area."""
-    cols, rows = 15, 9
-    cell_w = (WIDTH - panel_w) / cols
-    cell_h = HEIGHT / rows
-
-    for row in range(rows):
-        for col in range(cols):
-            noise_spd = speed_base * (0.75 + 0.5 * math.sin(col * 0.9 + row * 1.3 + 0.5))
-            noise_dir = dir_base  + 18 * math.sin(col * 1.4 + row * 0.8)
-
-            colour = wind_color(noise_spd)
-            cx = int(panel_w + (col + 0.5) * cell_w)
-            cy = int((row + 0.5) * cell_h)
-
-            length = max(6, int(noise_spd / 5))
-            rad = math.radians(noise_dir - 180)
-            ex = cx + int(math.sin(rad) * length)
-            ey = cy - int(math.cos(rad) * length)
-
-            draw.line([(cx, cy), (ex, ey)], fill=(*colour, 200), width=2)
-            draw.ellipse([(ex - 2, ey - 2), (ex + 2, ey + 2)],
-                         fill=(*colour, 240))
-
 # ── Left data panel ──────────────────────────────────────────────────────────
 
-def draw_panel(draw, weather, panel_w):
+def draw_panel(draw, weather, panel_w, now_utc):
     cur    = weather["current"]
     temp   = cur["temperature_2m"]
     feel   = cur["apparent_temperature"]
@@ -378,10 +541,10 @@ def draw_panel(draw, weather, panel_w):
     draw.line([(panel_w - 1, 0), (panel_w - 1, HEIGHT)],
               fill=(60, 80, 120, 255), width=1)
 
-    fnt_big   = ImageFont.load_default(size=30)
-    fnt_med   = ImageFont.load_default(size=14)
-    fnt_small = ImageFont.load_default(size=11)
-    fnt_tiny  = ImageFont.load_default(size=9)
+    fnt_big   = _FNT_30
+    fnt_med   = _FNT_14
+    fnt_small = _FNT_11
+    fnt_tiny  = _FNT_9
 
     WHITE  = (240, 240, 255)
     GREY   = (150, 155, 180)
@@ -445,7 +608,7 @@ def draw_panel(draw, weather, panel_w):
     draw.text((10, y), "Scania, Sweden", fill=DIM, font=fnt_tiny)
 
     # Timestamp
-    ts = datetime.datetime.now(datetime.timezone.utc).strftime("%d %b %H:%MZ")
+    ts = now_utc.strftime("%d %b %H:%MZ")
     draw.text((10, HEIGHT - 13), ts, fill=DIM, font=fnt_tiny)
 
 # ── 24-hour wind chart ───────────────────────────────────────────────────────
@@ -461,7 +624,7 @@ def draw_hourly_chart(draw, weather, panel_w):
     CHART_W = WIDTH - panel_w - 12
     CHART_H = 38
 
-    fnt = ImageFont.load_default(size=9)
+    fnt = _FNT_9
     GREY = (130, 135, 160)
 
     # Background
@@ -473,17 +636,21 @@ def draw_hourly_chart(draw, weather, panel_w):
     max_spd = max(max(h_gust), 10.0)
     bw = max(1, CHART_W // 24)
 
-    for h in range(len(h_spd)):
-        bx = CHART_X + int(h * CHART_W / 24)
+    # Bar positions, heights and colours for all hours in one go
+    spd  = np.asarray(h_spd, dtype=np.float64)
+    gust = np.asarray(h_gust[:len(h_spd)], dtype=np.float64)
+    bxs  = (CHART_X + np.arange(len(spd)) * CHART_W / 24).astype(int).tolist()
+    ghs  = (gust / max_spd * CHART_H).astype(int).tolist()
+    shs  = (spd  / max_spd * CHART_H).astype(int).tolist()
+    gcs  = wind_colors(gust).tolist()
+    scs  = wind_colors(spd).tolist()
+
+    for bx, gh, sh, gc, sc in zip(bxs, ghs, shs, gcs, scs):
         # gust bar (lighter, full height)
-        gh = int(h_gust[h] / max_spd * CHART_H)
-        gc = wind_color(h_gust[h])
         draw.rectangle([(bx, CHART_Y + CHART_H - gh),
                         (bx + bw - 1, CHART_Y + CHART_H)],
                        fill=(*gc, 90))
         # speed bar (solid)
-        sh = int(h_spd[h] / max_spd * CHART_H)
-        sc = wind_color(h_spd[h])
         draw.rectangle([(bx, CHART_Y + CHART_H - sh),
                         (bx + bw - 1, CHART_Y + CHART_H)],
                        fill=(*sc, 200))
@@ -507,12 +674,12 @@ def draw_pin(draw, canvas_ox_f, canvas_oy_f):
         draw.ellipse([(cx - 2, cy - 2), (cx + 2, cy + 2)],
                      fill=(255, 255, 255, 255))
         draw.text((cx + 9, cy - 6), f"{PIN_LAT:.2f}°N",
-                  fill=(255, 240, 240), font=ImageFont.load_default(size=9))
+                  fill=(255, 240, 240), font=_FNT_9)
 
 # ── Attribution ──────────────────────────────────────────────────────────────
 
 def draw_attribution(draw):
-    fnt = ImageFont.load_default(size=8)
+    fnt = _FNT_8
     draw.text((PANEL_W + 3, HEIGHT - 9), TILE_ATTR,
               fill=(80, 85, 110, 200), font=fnt)
 
@@ -520,33 +687,61 @@ def draw_attribution(draw):
 
 def to_rgb565(img_rgb):
     """Convert PIL RGB image to flat numpy uint16 array (RGB565, LE)."""
-    arr = np.array(img_rgb, dtype=np.uint16)
-    r = (arr[:, :, 0] >> 3).astype(np.uint16)
-    g = (arr[:, :, 1] >> 2).astype(np.uint16)
-    b = (arr[:, :, 2] >> 3).astype(np.uint16)
-    return ((r << 11) | (g << 5) | b).flatten()
+    arr = np.asarray(img_rgb, dtype=np.uint8)
+    # Mask/shift on uint8 and widen only when OR-ing into the output buffer
+    out = (arr[:, :, 0] & 0xF8).astype(np.uint16)
+    out <<= 8
+    g = (arr[:, :, 1] & 0xFC).astype(np.uint16)
+    g <<= 3
+    out |= g
+    out |= arr[:, :, 2] >> 3
+    # '<u2' is a no-op view on little-endian hosts; ravel() is a view too
+    return out.astype("<u2", copy=False).ravel()
+
+# ── Night-mode tint ──────────────────────────────────────────────────────────
+
+# Dark overlay colour + alpha. Blending a constant colour is a per-channel
+# affine map, so it is applied as a 3×256 Image.point() table (float32 maths
+# to match Image.blend bit-for-bit) without allocating a tint image.
+DARK_TINT  = (0, 4, 18)
+DARK_ALPHA = 145
+
+def _build_dark_lut():
+    v = np.arange(256, dtype=np.float32)
+    a = np.float32(DARK_ALPHA / 255)
+    return np.concatenate([v + a * (np.float32(t) - v)
+                           for t in DARK_TINT]).astype(np.uint8).tolist()
+
+_DARK_LUT = _build_dark_lut()
 
 # ── Main render ──────────────────────────────────────────────────────────────
 
 def render(weather, sensors,
            out_png_temp, out_bin_temp,
            out_png_hum,  out_bin_hum,
-           out_h):
+           out_h, map_canvas=None):
+    """Render both views. `map_canvas` is a prefetched build_map_canvas()
+    result; if None the tiles are fetched here."""
+    # One timestamp for the panel and the C header
+    now_utc = datetime.datetime.now(datetime.timezone.utc)
+
     # 1. Map background
-    map_img, ox_f, oy_f = build_map_canvas(MAP_LAT, MAP_LON, ZOOM)
+    if map_canvas is None:
+        map_canvas = build_map_canvas(MAP_LAT, MAP_LON, ZOOM)
+    map_img, ox_f, oy_f = map_canvas
 
-    # 2. Dark overlay (Windy night-mode feel)
-    dark = Image.new("RGBA", (WIDTH, HEIGHT), (0, 4, 18, 145))
-    img  = map_img.convert("RGBA")
-    img  = Image.alpha_composite(img, dark)
+    # 2. Dark overlay (Windy night-mode feel) – base image shared by both views
+    base_rgb = map_img.point(_DARK_LUT)
 
-    draw = ImageDraw.Draw(img, "RGBA")
+    # Primitives are drawn opaque (the alpha in their fill tuples is ignored
+    # on an RGB image), so the whole base stays RGB with no mode conversions.
+    draw = ImageDraw.Draw(base_rgb)
 
     # 3. Forecast pin
     draw_pin(draw, ox_f, oy_f)
 
     # 4. Data panel (drawn on top)
-    draw_panel(draw, weather, PANEL_W)
+    draw_panel(draw, weather, PANEL_W, now_utc)
 
     # 5. 24-hour wind chart (bottom strip, y ≥ 210)
     draw_hourly_chart(draw, weather, PANEL_W)
@@ -554,23 +749,32 @@ def render(weather, sensors,
     # 6. Attribution
     draw_attribution(draw)
 
-    # Flatten to RGB – base image without sensor tiles
-    base_rgb = img.convert("RGB")
+    # 7. Sensor tile backgrounds (shared by both views)
+    draw_sensor_tile_backgrounds(draw)
+
+    # The views differ only inside the tile area: convert the shared base to
+    # RGB565 once, then per view draw and convert just the 330×210 tile crop.
+    base_px = to_rgb565(base_rgb).reshape(HEIGHT, WIDTH)
+    x0, y0, x1, y1 = TILE_AREA_BOX
 
     def _save_view(mode, out_png, out_bin):
+        tiles = base_rgb.crop(TILE_AREA_BOX)
+        draw_sensor_tiles(ImageDraw.Draw(tiles), sensors, mode, origin=(0, 0))
+
         view = base_rgb.copy()
-        d = ImageDraw.Draw(view)
-        draw_sensor_tiles(d, sensors, mode)
+        view.paste(tiles, (x0, y0))
         view.save(out_png)
         print(f"Preview  → {out_png}")
-        pixels = to_rgb565(view)
+
+        pixels = base_px.copy()
+        pixels[y0:y1, x0:x1] = to_rgb565(tiles).reshape(y1 - y0, x1 - x0)
+        pixels = pixels.ravel()
         with open(out_bin, "wb") as f:
-            for px in pixels:
-                f.write(struct.pack("<H", int(px)))
-        print(f"Binary   → {out_bin}  ({len(pixels) * 2:,} bytes)")
-        return view, pixels
+            pixels.tofile(f)
+        print(f"Binary   → {out_bin}  ({pixels.nbytes:,} bytes)")
+        return pixels
 
-    img_temp, pixels_temp = _save_view('temp', out_png_temp, out_bin_temp)
+    pixels_temp = _save_view('temp', out_png_temp, out_bin_temp)
     _save_view('hum', out_png_hum, out_bin_hum)
 
     # C header from temperature image (used as boot Flash snapshot in firmware)
@@ -578,38 +782,38 @@ def render(weather, sensors,
         return
 
     cur   = weather["current"]
-    ts    = datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%d %H:%MZ")
+    ts    = now_utc.strftime("%Y-%m-%d %H:%MZ")
     total = WIDTH * HEIGHT
-    with open(out_h, "w") as f:
-        f.write("/* ------------------------------------------------------------------ *\n")
-        f.write(" * windy_img.h  --  auto-generated by tools/windy_render.py\n")
-        f.write(f" * {ts}  |  {PIN_LAT}degN {PIN_LON}degE  |  zoom {ZOOM}\n")
-        f.write(f" * {cur['temperature_2m']}degC  "
-                f"wind {cur['wind_speed_10m']} km/h @ {cur['wind_direction_10m']}deg\n")
-        f.write(" * Temperature view (boot snapshot) -- re-run windy_render.py to refresh\n")
-        f.write(" * ------------------------------------------------------------------ */\n\n")
-        f.write("#ifndef WINDY_IMG_H\n#define WINDY_IMG_H\n\n")
-        f.write("#include <stdint.h>\n\n")
-        f.write(f"#define WINDY_IMG_WIDTH  {WIDTH}U\n")
-        f.write(f"#define WINDY_IMG_HEIGHT {HEIGHT}U\n")
-        f.write(f"/* {total:,} px x 2 bytes = {total*2:,} bytes in Flash .rodata */\n\n")
-        f.write("/* Placed in Flash by the linker (const -> .rodata).\n")
-        f.write("   LTDC can read directly from Flash via AHB -- no memcpy needed. */\n")
-        f.write(f"static const uint16_t windy_img[{total}U] = {{\n")
-        PER_LINE = 16
-        for i, px in enumerate(pixels_temp):
-            if i % PER_LINE == 0:
-                f.write("    ")
-            f.write(f"0x{int(px):04X}")
-            if i < total - 1:
-                f.write(",")
-            if i % PER_LINE == PER_LINE - 1:
-                f.write("\n")
-            else:
-                f.write(" ")
-        if total % PER_LINE != 0:
-            f.write("\n")
-        f.write("};\n\n#endif /* WINDY_IMG_H */\n")
+    PER_LINE = 16
+    # Hex-dump the big-endian bytes in C ("ABCD,EF01,…": 4 digits + comma per
+    # pixel), then slice that into lines – no per-pixel Python formatting
+    hx   = pixels_temp.astype(">u2").tobytes().hex(",", 2).upper()
+    step = PER_LINE * 5
+    rows = ["    0x" + hx[i:i + step - 1].replace(",", ", 0x")
+            for i in range(0, len(hx), step)]
+    parts = [
+        "/* ------------------------------------------------------------------ *\n",
+        " * windy_img.h  --  auto-generated by tools/windy_render.py\n",
+        f" * {ts}  |  {PIN_LAT}degN {PIN_LON}degE  |  zoom {ZOOM}\n",
+        f" * {cur['temperature_2m']}degC  "
+        f"wind {cur['wind_speed_10m']} km/h @ {cur['wind_direction_10m']}deg\n",
+        " * Temperature view (boot snapshot) -- re-run windy_render.py to refresh\n",
+        " * ------------------------------------------------------------------ */\n\n",
+        "#ifndef WINDY_IMG_H\n#define WINDY_IMG_H\n\n",
+        "#include <stdint.h>\n\n",
+        f"#define WINDY_IMG_WIDTH  {WIDTH}U\n",
+        f"#define WINDY_IMG_HEIGHT {HEIGHT}U\n",
+        f"/* {total:,} px x 2 bytes = {total*2:,} bytes in Flash .rodata */\n\n",
+        "/* Placed in Flash by the linker (const -> .rodata).\n",
+        "   LTDC can read directly from Flash via AHB -- no memcpy needed. */\n",
+        f"static const uint16_t windy_img[{total}U] = {{\n",
+        ",\n".join(rows),
+        "\n",
+        "};\n\n#endif /* WINDY_IMG_H */\n",
+    ]
+    # Assemble in memory and hand the whole file to the OS in one write
+    with open(out_h, "wb") as f:
+        f.write("".join(parts).encode("ascii"))
     print(f"C header -> {out_h}  ({os.path.getsize(out_h):,} bytes)")
 
 # ── Entry point ──────────────────────────────────────────────────────────────
@@ -629,14 +833,37 @@ if __name__ == "__main__":
                     help="Output path for humidity PNG preview (default: tools/windy_hum.png)")
     ap.add_argument("--no-header", action="store_true",
                     help="Skip C header generation (use on server, not dev machine)")
+    ap.add_argument("--cache-ttl", type=float, default=TILE_CACHE_TTL / 86400,
+                    help="Max age of cached OSM tiles in days (default: 7)")
+    ap.add_argument("--no-cache", action="store_true",
+                    help="Do not read or write the on-disk tile cache (tools/.tile_cache)")
+    ap.add_argument("--weather-ttl", type=float, default=WEATHER_TTL,
+                    help="Reuse the cached forecast for this many seconds before "
+                         "revalidating with Open-Meteo (default: 300)")
+    ap.add_argument("--no-weather-cache", action="store_true",
+                    help="Do not read or write the forecast cache (tools/.weather_cache.json)")
     args = ap.parse_args()
 
-    from ha_config import ROOMS, HA_URL, HA_TOKEN  # noqa: E402
+    TILE_CACHE_TTL = args.cache_ttl * 86400
+    if args.no_cache:
+        TILE_CACHE_DIR = None
+    WEATHER_TTL = args.weather_ttl
+    if args.no_weather_cache:
+        WEATHER_CACHE = None
+
+    from ha_config import ROOMS, HA_URL, ha_token  # noqa: E402
+
+    # The tile download is independent of the weather / HA requests:
+    # run it in the background so total latency is the slower of the two.
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        map_fut = ex.submit(build_map_canvas, MAP_LAT, MAP_LON, ZOOM)
+
+        weather = fetch_weather(PIN_LAT, PIN_LON)
 
-    weather = fetch_weather(PIN_LAT, PIN_LON)
+        print("Fetching HA sensors…")
+        sensors = fetch_ha_sensors(ROOMS, HA_URL, ha_token())
 
-    print("Fetching HA sensors…")
-    sensors = fetch_ha_sensors(ROOMS, HA_URL, HA_TOKEN)
+        map_canvas = map_fut.result()
 
     render(
         weather,
@@ -647,5 +874,6 @@ if __name__ == "__main__":
         out_bin_hum=args.out_bin_hum,
         out_h=None if args.no_header
               else os.path.join(HERE, "../Core/Inc/windy_img.h"),
+        map_canvas=map_canvas,
     )
     print("Done.")